@@ -179,6 +179,17 @@ async def get_cookies(**server):
     return b', '.join(request.headers.getlist(b'cookie'))
 
 
+@app.route('/getallcookies')
+async def get_all_cookies(**server):
+    data = []
+
+    for name, value in server['request'].cookies.items():
+        data.append('%s=%s' % (name, ','.join(value)))
+
+    # b'c=4; a=3,1; b=2'
+    return '; '.join(data)
+
+
 async def coro_acquire(lock):
     await lock.acquire()
     await asyncio.sleep(10)
@@ -159,6 +159,42 @@ class TestHTTPServer(unittest.TestCase):
         self.assertEqual(header[:header.find(b'\r\n')], b'HTTP/1.1 200 OK')
         self.assertEqual(read_chunked(body), b'a=123, a=xxx, yyy')
 
+    def test_get_cookies_order_11(self):
+        header, body = getcontents(host=HTTP_HOST,
+                                   port=HTTP_PORT,
+                                   method='GET',
+                                   url='/getallcookies',
+                                   version='1.1',
+                                   headers=[
+                                       'Cookie: a=1; b=2',
+                                       'Cookie: a=3; c=4'
+                                   ])
+
+        self.assertEqual(header[:header.find(b'\r\n')], b'HTTP/1.1 200 OK')
+        self.assertEqual(read_chunked(body), b'c=4; a=3,1; b=2')
+
+    def test_get_cookies_limit_11(self):
+        header, body = getcontents(
+            host=HTTP_HOST,
+            port=HTTP_PORT,
+            method='GET',
+            url='/getallcookies',
+            version='1.1',
+            headers=[
+                'Cookie: ' + '; '.join('a%d=%d' % (i, i) for i in range(60)),
+                'Cookie: ' + '; '.join('b%d=%d' % (i, i) for i in range(60))
+            ]
+        )
+
+        self.assertEqual(header[:header.find(b'\r\n')], b'HTTP/1.1 200 OK')
+
+        # the limit of 100 is shared by both headers, the last one first
+        cookies = read_chunked(body).split(b'; ')
+
+        self.assertEqual(len(cookies), 100)
+        self.assertEqual(cookies[:2], [b'b59=59', b'b58=58'])
+        self.assertEqual(cookies[-2:], [b'a21=21', b'a20=20'])
+
     def test_head_10(self):
         header, body = getcontents(host=HTTP_HOST,
                                    port=HTTP_PORT,
@@ -217,6 +253,18 @@ class TestHTTPServer(unittest.TestCase):
         self.assertEqual(read_chunked(body),
                          b'username=myuser&password=mypass')
 
+    def test_post_form_empty(self):
+        header, body = getcontents(
+            host=HTTP_HOST,
+            port=HTTP_PORT,
+            raw=b'POST /submitform HTTP/1.0\r\nHost: localhost:%d\r\n'
+                b'Content-Type: application/x-www-form-urlencoded\r\n'
+                b'Content-Length: 0\r\n\r\n' % HTTP_PORT
+        )
+
+        self.assertEqual(header[:header.find(b'\r\n')], b'HTTP/1.0 200 OK')
+        self.assertEqual(body, b'')
+
     def test_post_form_limit(self):
         header, body = getcontents(host=HTTP_HOST,
                                    port=HTTP_PORT,
@@ -364,6 +412,23 @@ class TestHTTPServer(unittest.TestCase):
         )
         self.assertTrue(b'Payload Too Large' in body)
 
+    def test_payloadtoolarge_chunked(self):
+        # the declared chunk size alone exceeds client_max_body_size
+        header, body = getcontents(
+            host=HTTP_HOST,
+            port=HTTP_PORT + 2,
+            raw=b'POST /upload HTTP/1.1\r\nHost: localhost:%d\r\n'
+                b'Transfer-Encoding: chunked\r\n\r\n%X\r\n\x00' % (
+                    HTTP_PORT, 1048576 + 8192)
+        )
+
+        self.assertEqual(header[:header.find(b'\r\n')],
+                         b'HTTP/1.1 413 Payload Too Large')
+        self.assertFalse(
+            b'\r\nContent-Type: application/octet-stream' in header
+        )
+        self.assertTrue(b'Payload Too Large' in body)
+
     def test_continue(self):
         header, body = getcontents(
             host=HTTP_HOST,
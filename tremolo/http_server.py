@@ -1,7 +1,11 @@
 # Copyright (c) 2023 nggit
 
 from .lib.http_protocol import HTTPProtocol
-from .lib.http_response import KEEPALIVE_OR_CLOSE, UPGRADE_OR_KEEPALIVE
+from .lib.http_response import (
+    KEEPALIVE_OR_CLOSE,
+    NO_CONTENT_STATUS,
+    UPGRADE_OR_KEEPALIVE
+)
 from .lib.sse import SSE
 from .lib.websocket import WebSocket
 
@@ -142,7 +146,7 @@ class HTTPServer(HTTPProtocol):
                 return
 
         status = self.response.get_status()
-        no_content = status[0] in (204, 205, 304) or 100 <= status[0] < 200
+        no_content = status[0] in NO_CONTENT_STATUS
         self.response.http_chunked = options.get(
             'chunked', self.request.version == b'1.1' and not no_content
         )
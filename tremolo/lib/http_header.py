@@ -2,6 +2,8 @@
 
 
 class Headers(dict):
+    __slots__ = ()
+
     def copy(self):
         return self.__class__(self)
 
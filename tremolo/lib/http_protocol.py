@@ -2,6 +2,7 @@
 
 import asyncio
 
+from tremolo.utils import parse_int
 from .contexts import ConnectionContext
 from .http_exceptions import (
     HTTPException, BadRequest, ExpectationFailed, RequestTimeout
@@ -149,7 +150,14 @@ class HTTPProtocol(asyncio.Protocol):
             mv = memoryview(data)
 
             while mv and self.queue is not None:
-                self.queue[i].put_nowait(mv[:buffer_size].tobytes())
+                if (mv.nbytes == len(data) <= buffer_size and
+                        type(data) is bytes):
+                    # immutable and fits in a single item.
+                    # queue it as is, without a copy
+                    self.queue[i].put_nowait(data)
+                else:
+                    self.queue[i].put_nowait(mv[:buffer_size].tobytes())
+
                 queue_size = self.queue[i].qsize()
 
                 if queue_size > self.options['max_queue_size']:
@@ -250,10 +258,10 @@ class HTTPProtocol(asyncio.Protocol):
 
                 if b'content-length' in self.request.headers:
                     try:
-                        self.request.content_length = int(
-                            b'+' + self.request.headers[b'content-length']
+                        self.request.content_length = parse_int(
+                            self.request.headers[b'content-length']
                         )
-                    except (ValueError, TypeError) as exc:
+                    except ValueError as exc:
                         raise BadRequest('bad Content-Length') from exc
 
                     if (b'%d' % self.request.content_length !=
@@ -312,8 +320,11 @@ class HTTPProtocol(asyncio.Protocol):
             return
 
         if self._header_buf is not None:
+            # resume the search, a terminator may span the previous packet
+            start = max(len(self._header_buf) - 3, 0)
+
             self._header_buf.extend(data)
-            header_size = self._header_buf.find(b'\r\n\r\n') + 2
+            header_size = self._header_buf.find(b'\r\n\r\n', start) + 2
 
             if 1 < header_size <= self.options['client_max_header_size']:
                 # this will keep blocking on bodyless requests forever, unless
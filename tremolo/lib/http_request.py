@@ -3,20 +3,23 @@
 import os
 import time
 
-from urllib.parse import parse_qs
-
-from tremolo.utils import parse_fields
+from tremolo.utils import parse_fields, parse_int, parse_query
 from .http_exceptions import BadRequest, PayloadTooLarge
+from .http_header import HTTPHeader
 from .request import Request
 
+# Python 3.15+: detach the contents of a bytearray without copying
+_TAKE_BYTES = getattr(bytearray, 'take_bytes', None)
+
 
 class HTTPRequest(Request):
     __slots__ = ('_ip',
                  '_scheme',
+                 '_media_type_params',
                  'header',
                  'headers',
                  'is_valid',
-                 'host',
+                 '_host',
                  'method',
                  'url',
                  'path',
@@ -30,21 +33,19 @@ class HTTPRequest(Request):
                  '_body',
                  '_eof',
                  '_read_instance',
-                 '_read_buf')
+                 '_read_buf',
+                 '_read_head')
 
     def __init__(self, protocol, header):
         super().__init__(protocol)
 
         self._ip = None
         self._scheme = None
+        self._media_type_params = None
         self.header = header
-        self.headers = header.headers.copy()
+        self.headers = header.headers
         self.is_valid = header.is_valid
-        self.host = header.gethost()
-
-        if isinstance(self.host, list):
-            self.host = self.host[0]
-
+        self._host = None
         self.method = header.getmethod().upper()
         self.url = header.geturl()
         self.path, _, self.query_string = self.url.partition(b'?')
@@ -62,21 +63,40 @@ class HTTPRequest(Request):
         self._eof = False
         self._read_instance = None
         self._read_buf = bytearray()
+        self._read_head = 0
+
+    @property
+    def host(self):
+        if self._host is None:
+            # not every handler needs it, so look it up on first access
+            host = self.header.gethost()
+
+            if isinstance(host, list):
+                host = host[0]
+
+            self._host = host
+
+        return self._host
+
+    @host.setter
+    def host(self, value):
+        self._host = value
 
     @property
     def ip(self):
         if not self._ip:
             ip = self.headers.get(b'x-forwarded-for', b'')
 
-            if isinstance(ip, list):
-                ip = ip[0]
+            if ip:
+                if isinstance(ip, list):
+                    ip = ip[0]
 
-            ip = ip.strip()
+                ip = ip.partition(b',')[0].strip()
 
-            if ip == b'' and self.client is not None:
+            if not ip and self.client is not None:
                 self._ip = self.client[0].encode('utf-8')
             else:
-                self._ip = ip[:(ip + b',').find(b',')]
+                self._ip = ip
 
         return self._ip
 
@@ -85,7 +105,7 @@ class HTTPRequest(Request):
         if not self._scheme:
             scheme = self.headers.get(b'x-forwarded-proto', b'').strip()
 
-            if scheme == b'' and self.is_secure:
+            if not scheme and self.is_secure:
                 self._scheme = b'https'
             else:
                 self._scheme = scheme or b'http'
@@ -97,6 +117,15 @@ class HTTPRequest(Request):
         # don't lower() content-type, as it may contain a boundary
         return self.headers.get(b'content-type', b'application/octet-stream')
 
+    def _parse_content_type(self):
+        # parsed once per request, as both form() and files() need it
+        if self._media_type_params is None:
+            media_type, _, params = self.content_type.partition(b';')
+            self._media_type_params = (media_type.strip().lower(),
+                                       dict(parse_fields(params)))
+
+        return self._media_type_params
+
     @property
     def upgraded(self):
         return self._upgraded
@@ -117,10 +146,10 @@ class HTTPRequest(Request):
         else:
             port = self.client[1]  # 0 - 65535
 
+        # port and pid (4 bytes), then time (8 bytes)
         prefix = (
-            int.to_bytes((port << 16) | (os.getpid() & 0xffff),
-                         4, byteorder='big') +
-            int(time.time() * 1e7).to_bytes(8, byteorder='big')
+            ((port << 16 | os.getpid() & 0xffff) << 64 |
+             int(time.time() * 1e7)).to_bytes(12, byteorder='big')
         )  # 12 Bytes
 
         return prefix + os.urandom(max(4, length - len(prefix)))
@@ -128,19 +157,51 @@ class HTTPRequest(Request):
     def clear_body(self):
         del self._body[:]
         del self._read_buf[:]
+        self._read_head = 0
         super().clear_body()
 
     async def body(self, raw=False):
-        async for data in self.stream(raw=raw):
-            self._body.extend(data)
+        if self.content_length == 0:
+            # nothing to read, don't even wait on the queue
+            self._eof = True
+
+        if self._eof or not raw and b'chunked' in self.transfer_encoding:
+            async for data in self.stream(raw=raw):
+                self._body.extend(data)
+
+            return self._body
+
+        # identity-encoded body: read the queue directly,
+        # without going through the stream() generator
+        self._begin_body()
 
+        async for data in super().recv():
+            self._body.extend(self._clip_body(data))
+
+        self._eof = True
         return self._body
 
+    def _begin_body(self):
+        # shared by body() and stream(), before the first read
+        if self.http_continue:
+            self.protocol.send_continue()
+
+        if self.content_length > self.protocol.options['client_max_body_size']:
+            raise PayloadTooLarge
+
+    def _clip_body(self, data):
+        if -1 < self.content_length < self.body_consumed:
+            # pipelining is not yet supported on a request with a body
+            self.protocol.logger.info('Content-Length mismatch')
+            return data[:self.content_length - self.body_consumed]
+
+        return data
+
     def read(self, size=-1):
         return self.recv(size=size, raw=False)
 
     def eof(self):
-        return self._eof and self._read_buf == b''
+        return self._eof and len(self._read_buf) == self._read_head
 
     async def recv(self, size=-1, raw=True):
         if size == 0 or self.eof():
@@ -152,99 +213,131 @@ class HTTPRequest(Request):
         if size == -1:
             return bytes(await self._read_instance.__anext__())
 
-        if len(self._read_buf) < size:
+        if len(self._read_buf) - self._read_head < size:
             async for data in self._read_instance:
                 self._read_buf.extend(data)
 
-                if len(self._read_buf) >= size:
+                if len(self._read_buf) - self._read_head >= size:
                     break
 
-        buf = self._read_buf[:size]
-        del self._read_buf[:size]
-        return bytes(buf)
+        start = self._read_head
+        self._read_head = min(start + size, len(self._read_buf))
+
+        if self._read_head == len(self._read_buf) and _TAKE_BYTES:
+            # everything buffered is consumed
+            del self._read_buf[:start]
+            self._read_head = 0
+
+            return _TAKE_BYTES(self._read_buf)
+
+        buf = bytes(self._read_buf[start:self._read_head])
+
+        if self._read_head > len(self._read_buf) // 2:
+            # compact only when the consumed part outweighs the unread one
+            del self._read_buf[:self._read_head]
+            self._read_head = 0
+
+        return buf
 
     async def stream(self, raw=False):
         if self._eof:
             return
 
-        if self.http_continue:
-            self.protocol.send_continue()
+        if self.content_length == 0:
+            self._eof = True
+            return
+
+        self._begin_body()
 
         if not raw and b'chunked' in self.transfer_encoding:
-            buf = bytearray()
+            buf = bytearray()  # holds an incomplete chunk-size line, if any
             agen = super().recv()
-            paused = False
-            unread_bytes = 0
+            unread_bytes = 0  # of the current chunk, including its CRLF
+            max_line_size = self.protocol.options['buffer_size'] * 4
+            max_body_size = self.protocol.options['client_max_body_size']
 
             while True:
-                if not paused:
-                    try:
-                        buf.extend(await agen.__anext__())
-                    except StopAsyncIteration as exc:
-                        if b'\r\n\r\n' not in buf:
-                            del buf[:]
-                            raise BadRequest(
-                                'bad chunked encoding: incomplete read'
-                            ) from exc
+                try:
+                    data = await agen.__anext__()
+                except StopAsyncIteration as exc:
+                    raise BadRequest(
+                        'bad chunked encoding: incomplete read'
+                    ) from exc
+
+                if buf:
+                    buf.extend(data)
+                    data = buf
 
-                if unread_bytes > 0:
-                    data = buf[:unread_bytes]
+                start = 0
+                pieces = []
+                eof = False
 
-                    yield data
-                    del buf[:unread_bytes]
+                while start < len(data):
+                    if unread_bytes > 2:
+                        # take the chunk data as is, without copying it
+                        # into buf first
+                        end = min(start + unread_bytes - 2, len(data))
 
-                    unread_bytes -= len(data)
+                        pieces.append(data[start:end])
+
+                        unread_bytes -= end - start
+                        start = end
+                        continue
 
                     if unread_bytes > 0:
+                        # skip the CRLF that terminates the chunk data
+                        size = min(unread_bytes, len(data) - start)
+                        unread_bytes -= size
+                        start += size
                         continue
 
-                    paused = True
-                    del buf[:2]
-                else:
-                    i = buf.find(b'\r\n')
+                    i = data.find(b'\r\n', start)
 
                     if i == -1:
-                        if len(buf) > self.protocol.options['buffer_size'] * 4:
-                            del buf[:]
+                        if len(data) - start > max_line_size:
                             raise BadRequest(
                                 'bad chunked encoding: no chunk size'
                             )
 
-                        paused = False
-                        continue
+                        break
 
                     try:
-                        chunk_size = int(b'0x' + buf[:i].split(b';', 1)[0], 16)
+                        chunk_size = int(
+                            b'0x' + data[start:i].split(b';', 1)[0], 16
+                        )
                     except ValueError as exc:
-                        del buf[:]
                         raise BadRequest('bad chunked encoding') from exc
 
                     if chunk_size < 1:
+                        eof = True
                         break
 
-                    data = buf[i + 2:i + 2 + chunk_size]
-                    unread_bytes = chunk_size - len(data)
+                    # fail before reading a chunk that cannot fit anyway
+                    max_body_size -= chunk_size
 
-                    yield data
+                    if max_body_size < 0:
+                        raise PayloadTooLarge
 
-                    if unread_bytes > 0:
-                        paused = False
-                        del buf[:]
-                    else:
-                        paused = True
-                        del buf[:chunk_size + i + 4]
-        else:
-            if (self.content_length >
-                    self.protocol.options['client_max_body_size']):
-                raise PayloadTooLarge
+                    unread_bytes = chunk_size + 2
+                    start = i + 2
 
-            async for data in super().recv():
-                if -1 < self.content_length < self.body_consumed:
-                    # pipelining is not yet supported on a request with a body
-                    self.protocol.logger.info('Content-Length mismatch')
-                    yield data[:self.content_length - self.body_consumed]
+                if len(pieces) == 1:
+                    yield pieces[0]
+                elif pieces:
+                    # small chunks that arrived together are yielded at once
+                    yield b''.join(pieces)
+
+                if eof:
+                    self._eof = True
+                    return
+
+                if data is buf:
+                    del buf[:start]
                 else:
-                    yield data
+                    buf.extend(data[start:])
+        else:
+            async for data in super().recv():
+                yield self._clip_body(data)
 
         self._eof = True
 
@@ -259,10 +352,8 @@ class HTTPRequest(Request):
         except KeyError:
             self.params['query'] = {}
 
-            if self.query_string != b'':
-                self.params['query'] = parse_qs(
-                    self.query_string.decode('latin-1'), max_num_fields=100
-                )
+            if self.query_string:
+                self.params['query'] = parse_query(self.query_string)
 
             return self.params['query']
 
@@ -274,18 +365,26 @@ class HTTPRequest(Request):
             self.params['cookies'] = {}
 
             if b'cookie' in self.headers:
-                cookie = self.headers[b'cookie']
+                cookies = self.headers[b'cookie']
 
-                if isinstance(self.headers[b'cookie'], list):
-                    cookie = b';'.join(self.headers[b'cookie'])
+                if not isinstance(cookies, list):
+                    cookies = [cookies]
 
-                for k, v in parse_fields(cookie):
-                    k = k.decode('latin-1')
+                max_fields = 100
 
-                    if k in self.params['cookies']:
-                        self.params['cookies'][k].append(v.decode('latin-1'))
-                    else:
-                        self.params['cookies'][k] = [v.decode('latin-1')]
+                # parse each header in place rather than joining them first.
+                # iterate backwards, as parse_fields() does within a header
+                for cookie in reversed(cookies):
+                    for k, v in parse_fields(cookie, max_fields=max_fields):
+                        k = k.decode('latin-1')
+                        max_fields -= 1
+
+                        if k in self.params['cookies']:
+                            self.params['cookies'][k].append(
+                                v.decode('latin-1')
+                            )
+                        else:
+                            self.params['cookies'][k] = [v.decode('latin-1')]
 
             return self.params['cookies']
 
@@ -295,8 +394,9 @@ class HTTPRequest(Request):
         except KeyError as exc:
             self.params['post'] = {}
 
-            if self.content_type.lower().startswith(
-                    b'application/x-www-form-urlencoded'):
+            media_type, _ = self._parse_content_type()
+
+            if media_type == b'application/x-www-form-urlencoded':
                 async for data in self.stream():
                     self._body.extend(data)
 
@@ -304,10 +404,8 @@ class HTTPRequest(Request):
                         raise ValueError('form size limit reached') from exc
 
                 if 2 < self.body_size <= max_size:
-                    self.params['post'] = parse_qs(
-                        self._body.decode('latin-1'),
-                        max_num_fields=max_fields
-                    )
+                    self.params['post'] = parse_query(self._body,
+                                                      max_fields=max_fields)
 
             return self.params['post']
 
@@ -315,106 +413,111 @@ class HTTPRequest(Request):
         if self.eof():
             return
 
-        for key, boundary in parse_fields(self.content_type):
-            if key == b'boundary' and boundary:
-                break
-        else:
+        _, params = self._parse_content_type()
+        boundary = params.get(b'boundary')
+
+        if not boundary:
             raise BadRequest('missing boundary')
 
         boundary_size = len(boundary)
-        header = None
+        delimiter = b'\r\n--' + boundary
+        dash_boundary = b'--' + boundary + b'\r\n'
+        close_delimiter = b'--' + boundary + b'--'
         body = bytearray()
 
-        header_size = 0
-        body_size = 0
-        content_length = 0
-        part = {}  # represents a file received in a multipart request
-        paused = False
-
         if self._read_instance is None:
             self._read_instance = self.stream()
 
-        while max_files > 0 and not self._read_buf.startswith(b'--%s--' %
-                                                              boundary):
-            data = b''
+        if self._read_head > 0:
+            del self._read_buf[:self._read_head]
+            self._read_head = 0
+
+        while max_files > 0 and not self._read_buf.startswith(close_delimiter):
+            part = {}  # represents a file received in a multipart request
+            content_length = 0
+            header_size = self._read_buf.find(b'\r\n\r\n') + 2
+
+            while header_size == 1:
+                if len(self._read_buf) > 8192:
+                    raise BadRequest(
+                        'malformed multipart/form-data: header too large'
+                    )
 
-            if not paused:
                 try:
                     data = await self._read_instance.__anext__()
                 except StopAsyncIteration as exc:
-                    if header_size == 1 or body_size == -1:
-                        del body[:]
-                        raise BadRequest(
-                            'malformed multipart/form-data: incomplete read'
-                        ) from exc
+                    raise BadRequest(
+                        'malformed multipart/form-data: incomplete read'
+                    ) from exc
 
-            if header is None:
+                start = max(len(self._read_buf) - 3, 0)
                 self._read_buf.extend(data)
-                header_size = self._read_buf.find(b'\r\n\r\n') + 2
 
-                if header_size == 1:
-                    if len(self._read_buf) > 8192:
-                        raise BadRequest(
-                            'malformed multipart/form-data: header too large'
-                        )
+                if self._read_buf.startswith(close_delimiter):
+                    return
 
-                    paused = False
-                else:
-                    body.extend(self._read_buf[header_size + 2:])
-
-                    # use find() instead of startswith() to ignore the preamble
-                    if self._read_buf.find(b'--%s\r\n' % boundary,
-                                           0, header_size) != -1:
-                        header = self.header.parse(
-                            self._read_buf, header_size=header_size
-                        ).headers
-
-                        if b'content-disposition' in header:
-                            for k, v in parse_fields(
-                                    header[b'content-disposition']):
-                                part[k.decode('latin-1')] = v.decode('latin-1')
-
-                        if b'content-length' in header:
-                            content_length = int(
-                                b'+' + header[b'content-length']
-                            )
-                            part['length'] = content_length
+                # only the newly arrived bytes, and the tail before them,
+                # need to be searched
+                header_size = self._read_buf.find(b'\r\n\r\n', start) + 2
+
+            body.extend(self._read_buf[header_size + 2:])
 
-                        if b'content-type' in header:
-                            part['type'] = header[
-                                           b'content-type'].decode('latin-1')
-                    else:
-                        header = {}
+            # use find() instead of startswith() to ignore the preamble
+            if self._read_buf.find(dash_boundary, 0, header_size) != -1:
+                # parsed separately, so the request headers are left intact
+                header = HTTPHeader(self._read_buf,
+                                    header_size=header_size).headers
 
-                continue
+                if b'content-disposition' in header:
+                    for k, v in parse_fields(header[b'content-disposition']):
+                        part[k.decode('latin-1')] = v.decode('latin-1')
 
-            body.extend(data)
-            body_size = body.find(b'\r\n--%s' % boundary, content_length)
+                if b'content-length' in header:
+                    content_length = parse_int(header[b'content-length'])
+                    part['length'] = content_length
 
-            if body_size == -1:
+                if b'content-type' in header:
+                    part['type'] = header[b'content-type'].decode('latin-1')
+
+            body_size = body.find(delimiter, content_length)
+
+            while body_size == -1:
                 if len(body) >= max_file_size > boundary_size + 4:
+                    # hand over the buffer itself instead of a copy of it.
+                    # only the tail is carried over to a new buffer
+                    tail = body[-boundary_size - 4:]
+                    del body[-boundary_size - 4:]
+
                     sub_part = part.copy()
-                    sub_part['data'] = body[:-boundary_size - 4]
+                    sub_part['data'] = body
                     sub_part['eof'] = False
                     yield sub_part
 
-                    content_length = max(
-                        content_length - (len(body) - boundary_size - 4), 0
-                    )
-                    del body[:-boundary_size - 4]
+                    content_length = max(content_length - len(body), 0)
+                    body = tail
 
-                paused = False
-                continue
+                # bytes before this position have been searched. only the tail
+                # is kept in case the delimiter is split across reads
+                search_pos = max(len(body) - boundary_size - 3, 0)
 
-            part['data'] = body[:body_size]
+                try:
+                    data = await self._read_instance.__anext__()
+                except StopAsyncIteration as exc:
+                    del body[:]
+                    raise BadRequest(
+                        'malformed multipart/form-data: incomplete read'
+                    ) from exc
+
+                body.extend(data)
+                body_size = body.find(delimiter,
+                                      max(content_length, search_pos))
+
+            self._read_buf[:] = body[body_size + 2:]
+            del body[body_size:]
+
+            part['data'] = body
             part['eof'] = True
             yield part
 
-            self._read_buf[:] = body[body_size + 2:]
-            header = None
-            content_length = 0
-            part = {}
-            paused = True
+            body = bytearray()
             max_files -= 1
-
-            del body[:]
@@ -5,10 +5,9 @@ import os
 import time
 
 from base64 import urlsafe_b64encode as b64encode
-from datetime import datetime, timedelta, timezone
 from urllib.parse import quote, unquote_to_bytes
 
-from tremolo.utils import parse_fields
+from tremolo.utils import http_date, parse_fields
 from .http_exceptions import (
     HTTPException,
     BadRequest,
@@ -29,6 +28,20 @@ UPGRADE_OR_KEEPALIVE = {
     False: b'keep-alive',
     True: b'upgrade'
 }
+NO_CONTENT_STATUS = frozenset((*range(100, 200), 204, 205, 304))
+_QUOTE_SAFE = (b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+               b'0123456789_.-~/')
+
+
+def _quote(data):
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+
+    if data.rstrip(_QUOTE_SAFE):
+        return quote(data).encode('latin-1')
+
+    # nothing to escape
+    return data
 
 
 class HTTPResponse(Response):
@@ -96,31 +109,42 @@ class HTTPResponse(Response):
         if isinstance(name, str):
             name = name.encode('latin-1')
 
-        value = quote(value).encode('latin-1')
-        date_expired = (
-            (datetime.now(timezone.utc) + timedelta(seconds=expires))
-            .strftime('%a, %d %b %Y %H:%M:%S GMT')
-            .encode('latin-1')
-        )
-        path = quote(path).encode('latin-1')
+        value = _quote(value)
 
-        cookie = bytearray(
-            b'%s=%s; expires=%s; max-age=%d; path=%s' %
+        if expires:
+            date_expired = http_date(time.time() + expires)
+        else:
+            # expires now. reuse the per-second Date value
+            date_expired = self.request.protocol.globals.info['server_date']
+
+        path = _quote(path)
+
+        cookie = [
+            b'Set-Cookie: %s=%s; expires=%s; max-age=%d; path=%s' %
             (name, value, date_expired, expires, path)
-        )
+        ]
+
+        if domain:
+            cookie.append(b'domain=' + _quote(domain))
 
-        for k, v in ((b'domain', domain), (b'samesite', samesite)):
-            if v:
-                cookie.extend(b'; %s=%s' % (k, quote(v).encode('latin-1')))
+        if samesite:
+            cookie.append(b'samesite=' + _quote(samesite))
 
-        for k, v in ((secure, b'; secure'), (httponly, b'; httponly')):
-            if k:
-                cookie.extend(v)
+        if secure:
+            cookie.append(b'secure')
+
+        if httponly:
+            cookie.append(b'httponly')
+
+        cookie = b'; '.join(cookie)
 
         if b'\n' in cookie:
             raise InternalServerError
 
-        self.append_header(b'Set-Cookie', cookie)
+        if b'set-cookie' in self.headers:
+            self.headers[b'set-cookie'].append(cookie)
+        else:
+            self.headers[b'set-cookie'] = [cookie]
 
     def set_status(self, status=200, message=b'OK'):
         if isinstance(message, str):
@@ -178,30 +202,41 @@ class HTTPResponse(Response):
 
             if content_length > 0 and (
                         self.request.method == b'HEAD' or
-                        status[0] in (204, 205, 304) or 100 <= status[0] < 200
+                        status[0] in NO_CONTENT_STATUS
                     ):
                 data = b''
 
             excludes = (b'connection', b'content-length', b'transfer-encoding')
 
-            await self.send(
+            header = (
                 b'HTTP/%s %d %s\r\nContent-Type: %s\r\nContent-Length: %d\r\n'
-                b'Connection: %s\r\n%s\r\n\r\n%s' %
+                b'Connection: %s\r\n%s\r\n\r\n' %
                 (self.request.version,
                  *status,
                  self.get_content_type(),
                  content_length,
                  KEEPALIVE_OR_CLOSE[keepalive and self.request.http_keepalive],
                  b'\r\n'.join(b'\r\n'.join(v) for k, v in self.headers.items()
-                              if k not in excludes),
-                 data), **kwargs
+                              if k not in excludes))
             )
+
+            if len(header) + len(data) <= kwargs.get('buffer_size', 16384):
+                # small enough to be sent as a single item
+                await self.send(header + data, **kwargs)
+            else:
+                # don't copy a large body just to prepend the header
+                await self.send(header, **kwargs)
+
+                if data:
+                    await self.send(data, **kwargs)
+
             self.headers_sent(True)
 
         self.close(keepalive=keepalive)
 
     async def write(self, data, chunked=None, buffer_size=16384, **kwargs):
         kwargs['buffer_size'] = buffer_size
+        header = b''
 
         if not self.headers_sent():
             self.set_base_headers()
@@ -210,8 +245,7 @@ class HTTPResponse(Response):
                 # this block is executed when write() is called outside the
                 # handler/middleware. e.g. ASGI server
                 status = self.get_status()
-                no_content = (status[0] in (204, 205, 304) or
-                              100 <= status[0] < 200)
+                no_content = status[0] in NO_CONTENT_STATUS
 
                 if chunked is None:
                     if self.http_chunked is None:
@@ -255,17 +289,28 @@ class HTTPResponse(Response):
                         low=kwargs.get('buffer_min_size', buffer_size // 2)
                     )
 
-            await self.send(
-                b' '.join(self.headers.pop(b'_line')) + b'\r\n' +
-                b'\r\n'.join(b'\r\n'.join(v) for v in self.headers.values()) +
-                b'\r\n\r\n'
+            # held back to be sent together with the first (small) chunk
+            header = (
+                b'%s\r\n%s\r\n\r\n' %
+                (b' '.join(self.headers.pop(b'_line')),
+                 b'\r\n'.join(b'\r\n'.join(v) for v in self.headers.values()))
             )
             self.headers_sent(True)
 
         if (self.http_chunked and not self.request.upgraded and
                 data is not None):
-            await self.send(b'%X\r\n%s\r\n' % (len(data), data), **kwargs)
+            if len(header) + len(data) <= buffer_size:
+                await self.send(b'%s%X\r\n%s\r\n' % (header, len(data), data),
+                                **kwargs)
+            else:
+                # don't copy a large chunk just to frame it
+                await self.send(b'%s%X\r\n' % (header, len(data)), **kwargs)
+                await self.send(data, **kwargs)
+                await self.send(b'\r\n', **kwargs)
         else:
+            if header:
+                await self.send(header)
+
             await self.send(data, **kwargs)
 
     async def sendfile(self, path, file_size=None, buffer_size=16384,
@@ -307,8 +352,7 @@ class HTTPResponse(Response):
         if not file_size:
             file_size = st.st_size
 
-        mdate = time.strftime('%a, %d %b %Y %H:%M:%S GMT',
-                              time.gmtime(st.st_mtime)).encode('latin-1')
+        mdate = http_date(st.st_mtime)
 
         if self.request.version == b'1.1' and b'range' in self.request.headers:
             if (b'if-range' in self.request.headers and
@@ -40,21 +40,25 @@ class Request:
 
     async def recv(self):
         while self.protocol.queue is not None:
-            task = self.protocol.loop.create_task(
-                self.protocol.queue[0].get()
-            )
-            timer = self.protocol.loop.call_at(
-                self.protocol.loop.time() +
-                self.protocol.options['keepalive_timeout'],
-                task.cancel
-            )
-
-            try:
-                data = await task
-            except asyncio.CancelledError as exc:
-                raise TimeoutError('recv timeout') from exc
-            finally:
-                timer.cancel()
+            if self.protocol.queue[0].qsize():
+                # already received, take it without a task and a timer
+                data = self.protocol.queue[0].get_nowait()
+            else:
+                task = self.protocol.loop.create_task(
+                    self.protocol.queue[0].get()
+                )
+                timer = self.protocol.loop.call_at(
+                    self.protocol.loop.time() +
+                    self.protocol.options['keepalive_timeout'],
+                    task.cancel
+                )
+
+                try:
+                    data = await task
+                except asyncio.CancelledError as exc:
+                    raise TimeoutError('recv timeout') from exc
+                finally:
+                    timer.cancel()
 
             if data is None:
                 break
@@ -9,7 +9,7 @@ class Response:
         self._send_buf = bytearray()
 
     def close(self):
-        if self._send_buf != b'':
+        if self._send_buf:
             self.send_nowait(self._send_buf[:])
             del self._send_buf[:]
 
@@ -28,15 +28,17 @@ class Response:
                 len(self._send_buf) < buffer_min_size):
             self._send_buf.extend(data)
         else:
+            if self._send_buf:
+                data = self._send_buf + data
+                del self._send_buf[:]
+
             await self._protocol.put_to_queue(
-                self._send_buf + data,
+                data,
                 i=1,
                 rate=rate,
                 buffer_size=buffer_size
             )
 
-            del self._send_buf[:]
-
     def send_nowait(self, data):
         if self._protocol.queue is not None:
             self._protocol.queue[1].put_nowait(data)
@@ -2,16 +2,22 @@
 
 __all__ = (
     'file_signature', 'html_escape', 'log_date', 'memory_usage',
-    'server_date', 'getoptions', 'parse_fields', 'parse_args'
+    'http_date', 'server_date', 'getoptions', 'parse_fields', 'parse_int',
+    'parse_query', 'parse_args'
 )
 
 import os  # noqa: E402
 import stat  # noqa: E402
 import sys  # noqa: E402
+import time  # noqa: E402
 
-from datetime import datetime, timezone  # noqa: E402
+from datetime import datetime  # noqa: E402
 from html import escape  # noqa: E402
-from urllib.parse import unquote_to_bytes as unquote  # noqa: E402
+from urllib.parse import parse_qs, unquote_to_bytes as unquote  # noqa: E402
+
+_WEEKDAYS = (b'Mon', b'Tue', b'Wed', b'Thu', b'Fri', b'Sat', b'Sun')
+_MONTHS = (b'Jan', b'Feb', b'Mar', b'Apr', b'May', b'Jun',
+           b'Jul', b'Aug', b'Sep', b'Oct', b'Nov', b'Dec')
 
 
 def file_signature(path):
@@ -46,9 +52,18 @@ def memory_usage(pid=0):
         return -1
 
 
+def http_date(timestamp=None):
+    # IMF-fixdate, without the locale-dependent strftime()
+    tm = time.gmtime(timestamp)
+
+    return b'%s, %02d %s %d %02d:%02d:%02d GMT' % (
+        _WEEKDAYS[tm.tm_wday], tm.tm_mday, _MONTHS[tm.tm_mon - 1],
+        tm.tm_year, tm.tm_hour, tm.tm_min, tm.tm_sec
+    )
+
+
 def server_date():
-    return datetime.now(timezone.utc).strftime(
-        '%a, %d %b %Y %H:%M:%S GMT').encode('latin-1')
+    return http_date()
 
 
 def getoptions(func):
@@ -87,6 +102,40 @@ def parse_fields(data, separator=b';', max_fields=100):
         end = start - 1
 
 
+def parse_int(data):
+    # strictly ASCII digits. unlike int(), no sign, whitespace or underscores
+    if isinstance(data, (bytes, bytearray)) and data.isdigit():
+        return int(data)
+
+    raise ValueError('invalid literal for parse_int(): %r' % (data,))
+
+
+def parse_query(data, max_fields=100):
+    # same as parse_qs(data.decode('latin-1'), max_num_fields=max_fields).
+    # ';' is left to parse_qs, as older Pythons also treat it as a separator
+    if b'%' in data or b'+' in data or b';' in data:
+        return parse_qs(data.decode('latin-1'), max_num_fields=max_fields)
+
+    if data.count(b'&') >= max_fields:
+        raise ValueError('Max number of fields exceeded')
+
+    result = {}
+
+    for field in data.split(b'&'):
+        name, _, value = field.partition(b'=')
+
+        # like parse_qs, skip blank values
+        if value:
+            name = name.decode('latin-1')
+
+            if name in result:
+                result[name].append(value.decode('latin-1'))
+            else:
+                result[name] = [value.decode('latin-1')]
+
+    return result
+
+
 def parse_args(**callbacks):
     options = {'host': '127.0.0.1', 'port': 8000, 'ssl': {}}
     context = {'options': options}